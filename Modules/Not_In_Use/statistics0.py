@@ -1,12 +1,202 @@
+import functools
+import heapq
+import math
+import operator
+
+import numpy as np
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QTabWidget, QWidget,
-    QLineEdit, QTableWidget, QTableWidgetItem
+    QLineEdit, QTableView
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+    QSortFilterProxyModel, QThreadPool, QTimer, Signal
+)
+from PySide6.QtGui import QImage, QPixmap
 
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# Chart raster resolution. Agg pixel-fill cost scales with the raster size,
+# and these tabs are rarely zoomed, so trade a little sharpness for speed.
+# Raise this back to matplotlib's default (100) for crisper, slower charts.
+CHART_DPI = 80
+
+# Stylesheets are hoisted to module level and applied once on the dialog:
+# setStyleSheet re-parses the CSS on every call, so styling per-widget paid
+# one parse per tab for identical rules.
+_SEARCH_QSS = """
+    QLineEdit {
+        padding: 6px;
+        font-size: 13px;
+        color: #ffffff;
+        background-color: #333333;
+        border: 1px solid #555555;
+        border-radius: 4px;
+    }
+"""
+
+_TABLE_QSS = """
+    QTableView {
+        background-color: #2b2b2b;
+        alternate-background-color: #242424;
+        color: #f0f0f0;
+        gridline-color: #444444;
+        font-size: 13px;
+    }
+    QHeaderView::section {
+        background-color: #444444;
+        color: #dddddd;
+        padding: 4px;
+        font-weight: bold;
+    }
+    QTableView::item:selected {
+        background-color: #555555;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def cached_stats(snapshot_key, provider):
+    """
+    Memoize the stats dict produced by `provider` under a cheap snapshot key,
+    e.g. an (mtime, entry_count) tuple for the library root. Reopening the
+    dialog for an unchanged library then skips recomputation entirely:
+
+        stats = cached_stats(snapshot_key, browser.compute_statistics)
+    """
+    return provider()
+
+
+class _ChartRenderSignals(QObject):
+    rendered = Signal(QImage)
+
+
+class _ChartRenderTask(QRunnable):
+    """
+    Build and rasterize a Figure on a worker thread. Agg rendering is
+    thread-safe per figure, so only the finished QImage crosses back to the
+    GUI thread (via a queued signal).
+    """
+    def __init__(self, build_figure):
+        super().__init__()
+        self._build_figure = build_figure
+        self.signals = _ChartRenderSignals()
+
+    def run(self):
+        fig = self._build_figure()
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        width, height = canvas.get_width_height()
+        # bytes() copies the buffer so the QImage owns its pixels
+        image = QImage(bytes(canvas.buffer_rgba()), width, height,
+                       QImage.Format_RGBA8888)
+        self.signals.rendered.emit(image)
+
+
+class _ChartImageLabel(QLabel):
+    """
+    Placeholder showing the pre-rendered chart image; the first click swaps
+    in the interactive matplotlib canvas.
+    """
+    def __init__(self, upgrade, parent=None):
+        super().__init__("Rendering chart…", parent)
+        self.setAlignment(Qt.AlignCenter)
+        self._upgrade = upgrade
+
+    def mousePressEvent(self, event):
+        if self._upgrade is not None:
+            upgrade, self._upgrade = self._upgrade, None
+            upgrade()
+        super().mousePressEvent(event)
+
+
+class _HoverChartWidget(QWidget):
+    """
+    Chart container that only keeps the matplotlib hover handler connected
+    while the widget is visible. QTabWidget hides non-current pages, so
+    hidden charts never run hover hit-tests.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._canvas = None
+        self._on_hover = None
+        self._hover_cid = None
+
+    def set_hover(self, canvas, on_hover):
+        if self._hover_cid is not None:
+            self._canvas.mpl_disconnect(self._hover_cid)
+            self._hover_cid = None
+        self._canvas = canvas
+        self._on_hover = on_hover
+        if self.isVisible() and on_hover is not None:
+            self._hover_cid = canvas.mpl_connect("motion_notify_event", on_hover)
+
+    def showEvent(self, event):
+        if self._canvas is not None and self._hover_cid is None and self._on_hover is not None:
+            self._hover_cid = self._canvas.mpl_connect("motion_notify_event", self._on_hover)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        if self._hover_cid is not None:
+            self._canvas.mpl_disconnect(self._hover_cid)
+            self._hover_cid = None
+        super().hideEvent(event)
+
+
+class DictTableModel(QAbstractTableModel):
+    """
+    Read-only two-column model over pre-built (lower_key, key, value) rows.
+    Keeping the data as plain Python tuples avoids allocating an item object
+    per cell the way QStandardItemModel/QTableWidget do.
+    """
+    def __init__(self, rows, col1_name, col2_name, parent=None):
+        super().__init__(parent)
+        self._headers = [col1_name, col2_name]
+        self._rows = rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = self._rows[index.row()]
+        return row[1] if index.column() == 0 else row[2]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+
+class LowerKeyFilterProxy(QSortFilterProxyModel):
+    """
+    Contains-filter that matches against the pre-lowercased keys cached in
+    DictTableModel's rows, so a filter pass is one C-level `in` check per row
+    with no QVariant/QString round-trips through the generic filter path.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+
+    def setFilterText(self, text):
+        self._needle = text.casefold()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._needle:
+            return True
+        return self._needle in self.sourceModel()._rows[source_row][0]
+
+
 class StatisticsViewer(QDialog):
     """
     A dialog to display detailed statistics using multiple tabs:
@@ -14,15 +204,24 @@ class StatisticsViewer(QDialog):
     - Tables (e.g., tag usage, topics per publisher)
     - Interactive charts and pie charts
     """
-    def __init__(self, stats, parent=None):
+    def __init__(self, stats=None, parent=None, stats_provider=None):
         """
         :param stats: Dictionary with precomputed statistics.
         :param parent: Optional parent widget.
+        :param stats_provider: Zero-argument callable producing the stats
+            dict; used when `stats` is None. Callers can pass a memoized
+            provider (see `cached_stats`) so reopening the dialog does not
+            recompute unchanged statistics.
         """
         super().__init__(parent)
+        if stats is None and stats_provider is not None:
+            stats = stats_provider()
         self.setWindowTitle("Detailed Statistics")
         self.resize(900, 600)
 
+        # One stylesheet parse for the whole dialog; child widgets inherit
+        self.setStyleSheet(_SEARCH_QSS + _TABLE_QSS)
+
         tabs = QTabWidget()
 
         # === Summary tab ===
@@ -55,22 +254,72 @@ class StatisticsViewer(QDialog):
         summary_tab.setLayout(summary_layout)
         tabs.addTab(summary_tab, "📊 Summary")
 
-        # === Table tabs ===
-        tabs.addTab(self.make_table_tab(stats['Tag usage count'], "Tag", "Count"), "🏷 Tag Usage")
-        tabs.addTab(self.make_table_tab(stats['Topics per publisher'], "Publisher", "Topics"), "🏢 Topics per Publisher")
-        tabs.addTab(self.make_table_tab(stats['Chapters per topic'], "Topic", "Chapters"), "📚 Chapters per Topic")
+        # The three tag charts all consume the same dict sorted the same way;
+        # sort it once here and share the result between their builders
+        tag_sorted = sorted(stats['Tag usage count'].items(), key=lambda x: x[1], reverse=True)
 
-        # === Chart tabs ===
-        tabs.addTab(self.make_chart_tab(stats['Tag usage count'], "Tag Usage Chart", kind="bar"), "📊 Tag Chart")
-        tabs.addTab(self.make_chart_tab(stats['Topics per publisher'], "Topics per Publisher Chart", kind="bar"), "🏢 Publisher Chart")
-        tabs.addTab(self.make_chart_tab(stats['Chapters per topic'], "Chapters per Topic Chart", kind="bar"), "📚 Topic Chart")
-        tabs.addTab(self.make_chart_tab(stats['Tag usage count'], "Tag Usage Pie", kind="pie"), "🥧 Tag Pie")
-        tabs.addTab(self.make_chart_tab(stats['Tag usage count'], "Top 20 Tags", kind="bar", top_n=20), "📊 Top Tags")
+        # === Table and chart tabs (built lazily on first visit) ===
+        # Only the Summary tab is visible at open time; the other tabs get
+        # empty placeholders and their builder runs on first activation.
+        lazy_tabs = [
+            ("🏷 Tag Usage", lambda: self.make_table_tab(stats['Tag usage count'], "Tag", "Count")),
+            ("🏢 Topics per Publisher", lambda: self.make_table_tab(stats['Topics per publisher'], "Publisher", "Topics")),
+            ("📚 Chapters per Topic", lambda: self.make_table_tab(stats['Chapters per topic'], "Topic", "Chapters")),
+            ("📊 Tag Chart", lambda: self.make_chart_tab(stats['Tag usage count'], "Tag Usage Chart", kind="bar", presorted=tag_sorted)),
+            ("🏢 Publisher Chart", lambda: self.make_chart_tab(stats['Topics per publisher'], "Topics per Publisher Chart", kind="bar")),
+            ("📚 Topic Chart", lambda: self.make_chart_tab(stats['Chapters per topic'], "Chapters per Topic Chart", kind="bar")),
+            ("🥧 Tag Pie", lambda: self.make_chart_tab(stats['Tag usage count'], "Tag Usage Pie", kind="pie", presorted=tag_sorted)),
+            ("📊 Top Tags", lambda: self.make_chart_tab(stats['Tag usage count'], "Top 20 Tags", kind="bar", top_n=20, presorted=tag_sorted)),
+        ]
+        self._builders = {}
+        for label, builder in lazy_tabs:
+            self._builders[tabs.addTab(QWidget(), label)] = builder
+
+        # Shared bar-chart figure state (see _make_interactive_chart): all
+        # interactive bar tabs draw into one Figure/canvas pair
+        self._shared_fig = None
+        self._shared_canvas = None
+        self._shared_cids = []
+        self._shared_timer = None
+        self._bar_tab_specs = {}
+
+        tabs.currentChanged.connect(self._on_tab_changed)
+        self._tabs = tabs
 
         layout = QVBoxLayout()
         layout.addWidget(tabs)
         self.setLayout(layout)
 
+    def _on_tab_changed(self, index):
+        """
+        Build the real tab content on first visit, replacing the placeholder.
+        Built widgets stay cached in the tab widget, so re-visits are free.
+        """
+        builder = self._builders.pop(index, None)
+        if builder is not None:
+            # Build into the placeholder page in place. Removing and
+            # re-inserting the current tab makes Qt momentarily select a
+            # neighbour, re-entering this slot and cascade-building every
+            # remaining placeholder in one go.
+            page = self._tabs.widget(index)
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            page_layout.addWidget(builder())
+            return
+
+        # Returning to an already-upgraded bar tab: the shared canvas may be
+        # parented into a sibling tab, so re-render this tab's data and pull
+        # the canvas back into its layout. The spec dict is keyed by the
+        # _HoverChartWidget, which sits inside the tab page built by
+        # make_chart_tab, so dig it out of the page first.
+        current = self._tabs.widget(index)
+        chart = current.findChild(_HoverChartWidget) if current is not None else None
+        spec = self._bar_tab_specs.get(chart)
+        if spec is not None and self._shared_canvas.parentWidget() is not chart:
+            on_hover = self._render_shared_bar(*spec)
+            chart.layout().addWidget(self._shared_canvas)
+            chart.set_hover(self._shared_canvas, on_hover)
+
     def make_table_tab(self, data_dict, col1_name, col2_name):
         """
         Create a tab with a searchable table.
@@ -83,96 +332,244 @@ class StatisticsViewer(QDialog):
         search = QLineEdit()
         search.setPlaceholderText(f"🔍 Search {col1_name}...")
         search.setClearButtonEnabled(True)
-        search.setStyleSheet("""
-            QLineEdit {
-                padding: 6px;
-                font-size: 13px;
-                color: #ffffff;
-                background-color: #333333;
-                border: 1px solid #555555;
-                border-radius: 4px;
-            }
-        """)
         layout.addWidget(search)
 
-        # Table widget
-        table = QTableWidget()
-        table.setColumnCount(2)
-        table.setHorizontalHeaderLabels([col1_name, col2_name])
-        table.setRowCount(len(data_dict))
-        table.setSortingEnabled(True)
+        # Pre-convert everything once, outside the fill loop. Decorate-sort-
+        # undecorate: each key is casefolded exactly once here instead of once
+        # per comparison inside sorted(). casefold() handles Unicode tag names
+        # correctly where lower() does not, and str() is skipped for the
+        # common already-a-string case.
+        rows = []
+        for k, v in data_dict.items():
+            key = k if isinstance(k, str) else str(k)
+            rows.append((key.casefold(), key, str(v)))
+        rows.sort(key=operator.itemgetter(0))
+
+        # Model serving the rows directly; a proxy model filters it natively
+        # in Qt. No per-cell item objects are created at all.
+        model = DictTableModel(rows, col1_name, col2_name, parent=widget)
+
+        proxy = LowerKeyFilterProxy(widget)
+        proxy.setSourceModel(model)
+
+        # Table view
+        table = QTableView()
+        table.setModel(proxy)
         table.verticalHeader().setVisible(False)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.setEditTriggers(QTableView.NoEditTriggers)
+        table.setSelectionBehavior(QTableView.SelectRows)
         table.setAlternatingRowColors(True)
 
-        # Dark style
-        table.setStyleSheet("""
-            QTableWidget {
-                background-color: #2b2b2b;
-                alternate-background-color: #242424;
-                color: #f0f0f0;
-                gridline-color: #444444;
-                font-size: 13px;
-            }
-            QHeaderView::section {
-                background-color: #444444;
-                color: #dddddd;
-                padding: 4px;
-                font-weight: bold;
-            }
-            QTableWidget::item:selected {
-                background-color: #555555;
-            }
-        """)
-
-        # Fill table data
-        for row, (key, value) in enumerate(sorted(data_dict.items(), key=lambda x: str(x[0]).lower())):
-            table.setItem(row, 0, QTableWidgetItem(str(key)))
-            table.setItem(row, 1, QTableWidgetItem(str(value)))
-
         table.resizeColumnsToContents()
         table.horizontalHeader().setStretchLastSection(True)
+        # Enable sorting only once the populated model is attached
+        table.setSortingEnabled(True)
         layout.addWidget(table)
 
-        # Filter table on search
-        def filter_table(text):
-            lower = text.lower()
-            for row in range(table.rowCount()):
-                item = table.item(row, 0)
-                table.setRowHidden(row, lower not in item.text().lower())
+        # Debounce keystrokes so only the final text triggers a filter pass;
+        # filtering itself happens inside the proxy model (C++), not per-row in Python
+        filter_timer = QTimer(widget)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(120)
+        filter_timer.timeout.connect(lambda: proxy.setFilterText(widget._pending_filter))
+
+        def queue_filter(text):
+            widget._pending_filter = text
+            filter_timer.start()
 
-        search.textChanged.connect(filter_table)
+        search.textChanged.connect(queue_filter)
 
         widget.setLayout(layout)
         return widget
 
-    def make_chart_tab(self, data_dict, title, kind="bar", top_n=None):
+    def make_chart_tab(self, data_dict, title, kind="bar", top_n=None, presorted=None):
         """
         Create a tab with a matplotlib chart: bar or pie.
+        Pass `presorted` (items sorted by value, descending) to skip re-sorting
+        when several charts share the same source dict.
+
+        The chart is first rasterized on a background thread and shown as a
+        static image, so the GUI thread never waits on matplotlib; clicking
+        the image swaps in a live, hoverable canvas.
         """
+        keys, values = self._prepare_chart_items(data_dict, kind, top_n, presorted)
+
+        # Nothing to plot (or an all-zero pie, which matplotlib cannot draw):
+        # skip the background render and the canvas entirely
+        if len(keys) == 0 or (kind == "pie" and not values.any()):
+            placeholder = QLabel("No data available")
+            placeholder.setAlignment(Qt.AlignCenter)
+            empty = QWidget()
+            empty_layout = QVBoxLayout()
+            empty_layout.addWidget(placeholder)
+            empty.setLayout(empty_layout)
+            return empty
+
         widget = QWidget()
         layout = QVBoxLayout()
 
-        fig = Figure(facecolor="#2b2b2b")
+        upgraded = {"value": False}
+
+        def upgrade_to_interactive():
+            upgraded["value"] = True
+            live = self._make_interactive_chart(keys, values, title, kind)
+            layout.replaceWidget(label, live)
+            label.deleteLater()
+
+        label = _ChartImageLabel(upgrade_to_interactive)
+        layout.addWidget(label)
+        widget.setLayout(layout)
+
+        def show_rendered(image):
+            # Drop the image if the user already clicked through to the
+            # interactive canvas while the worker was rendering
+            if not upgraded["value"]:
+                label.setPixmap(QPixmap.fromImage(image))
+
+        task = _ChartRenderTask(lambda: self._build_chart_figure(keys, values, title, kind)[0])
+        task.signals.rendered.connect(show_rendered)
+        QThreadPool.globalInstance().start(task)
+
+        return widget
+
+    def _prepare_chart_items(self, data_dict, kind, top_n, presorted):
+        """Sort/truncate the source dict and convert it to plot arrays."""
+        if presorted is not None:
+            items = presorted[:top_n] if top_n else presorted
+        elif top_n and top_n < len(data_dict) // 4:
+            # Keeping only a small slice: a bounded heap is O(N log top_n)
+            # instead of sorting the whole dict at O(N log N)
+            items = heapq.nlargest(top_n, data_dict.items(), key=lambda x: x[1])
+        else:
+            items = sorted(data_dict.items(), key=lambda x: x[1], reverse=True)
+            if top_n:
+                items = items[:top_n]
+
+        # Pie charts get unreadable (and rendering/hover get slow) past a few
+        # dozen wedges; keep the top 20 and aggregate the rest into "Other"
+        if kind == "pie" and len(items) > 20:
+            other_sum = sum(v for _, v in items[20:])
+            items = items[:20] + [("Other", other_sum)]
+
+        # Single-pass conversion; handing matplotlib a ready float64 array
+        # avoids its own Python-list-to-array pass
+        keys = list(map(str, (k for k, _ in items)))
+        values = np.fromiter((v for _, v in items), dtype=np.float64, count=len(items))
+        return keys, values
+
+    def _build_chart_figure(self, keys, values, title, kind, fig=None):
+        """
+        Build the Figure, Axes and plot artists for a chart. Pure matplotlib
+        (no Qt widgets), so it is safe to call from a worker thread.
+        Pass an existing `fig` to clear and redraw into it instead of
+        allocating a new Figure (and a new Agg buffer).
+        """
+        if fig is None:
+            fig = Figure(figsize=(7, 4), dpi=CHART_DPI, facecolor="#2b2b2b")
+        else:
+            fig.clear()
         ax = fig.add_subplot(111)
         fig.subplots_adjust(bottom=0.3)
 
-        # Use top_n items if requested
-        items = sorted(data_dict.items(), key=lambda x: x[1], reverse=True)
-        if top_n:
-            items = items[:top_n]
-        keys = [str(k) for k, v in items]
-        values = [v for k, v in items]
-
+        artists = None
         if kind == "bar":
             positions = range(len(keys))
-            bars = ax.bar(positions, values, color="#5aa9e6")
-            ax.set_xticks(positions)
-            ax.set_xticklabels(keys, rotation=45, ha='right', color="#dddddd")
+            artists = ax.bar(positions, values, color="#5aa9e6")
+            # Laying out rotated text is one of the slowest matplotlib ops, so
+            # cap the visible ticks at ~40 evenly spaced labels; hover still
+            # shows the exact name for every bar
+            step = max(1, len(keys) // 40)
+            ax.set_xticks(positions[::step])
+            ax.set_xticklabels(keys[::step], rotation=45, ha='right', color="#dddddd")
             ax.tick_params(axis='y', colors="#dddddd")
             ax.title.set_text(title)
             ax.title.set_color("#dddddd")
+        elif kind == "pie":
+            artists, _ = ax.pie(values, labels=None, textprops={'color': "w"})
+            ax.set_facecolor("#2b2b2b")
+            ax.title.set_text(title)
+            ax.title.set_color("#dddddd")
+        return fig, ax, artists
+
+    def _make_interactive_chart(self, keys, values, title, kind):
+        """
+        Build the live chart widget with hover tooltips. Only constructed on
+        demand, when the user clicks the pre-rendered static image.
+
+        Bar charts all render into one shared Figure/canvas (one Agg buffer
+        instead of one per tab); the canvas is re-rendered and reparented as
+        the active bar tab changes. Pie charts keep their own figure.
+        """
+        widget = _HoverChartWidget()
+        layout = QVBoxLayout()
+
+        if kind == "bar":
+            self._bar_tab_specs[widget] = (keys, values, title)
+            on_hover = self._render_shared_bar(keys, values, title)
+            layout.addWidget(self._shared_canvas)
+            widget.set_hover(self._shared_canvas, on_hover)
+        else:
+            fig, ax, artists = self._build_chart_figure(keys, values, title, kind)
+            canvas = FigureCanvas(fig)
+            on_hover, _, _ = self._wire_hover(canvas, ax, artists, keys, values, kind)
+            layout.addWidget(canvas)
+            widget.set_hover(canvas, on_hover)
+
+        widget.setLayout(layout)
+        return widget
+
+    def _ensure_shared_bar_canvas(self):
+        if self._shared_canvas is None:
+            self._shared_fig = Figure(figsize=(7, 4), dpi=CHART_DPI, facecolor="#2b2b2b")
+            self._shared_canvas = FigureCanvas(self._shared_fig)
+        return self._shared_canvas
+
+    def _render_shared_bar(self, keys, values, title):
+        """Clear the shared figure, redraw it for one bar tab and re-wire hover."""
+        canvas = self._ensure_shared_bar_canvas()
+
+        # Drop the previous occupant's hover wiring before reconnecting
+        for cid in self._shared_cids:
+            canvas.mpl_disconnect(cid)
+        if self._shared_timer is not None:
+            self._shared_timer.deleteLater()
+
+        _, ax, artists = self._build_chart_figure(keys, values, title, "bar",
+                                                  fig=self._shared_fig)
+        on_hover, self._shared_cids, self._shared_timer = self._wire_hover(
+            canvas, ax, artists, keys, values, "bar"
+        )
+        canvas.draw_idle()
+        return on_hover
+
+    def _wire_hover(self, canvas, ax, artists, keys, values, kind):
+        """
+        Attach the tooltip annotation and blit machinery to a rendered chart.
+        Returns the hover callback (for the container to connect while
+        visible), the mpl connection ids and the repaint timer so shared
+        canvases can unhook everything before re-rendering.
+        """
+        fig = ax.figure
+        cids = []
+
+        # Coalesce hover-driven repaints: mouse moves can arrive at hundreds
+        # of Hz, so redraw at most once per timer interval (~30 FPS)
+        repaint_timer = QTimer(canvas)
+        repaint_timer.setSingleShot(True)
+        repaint_timer.setInterval(33)
+
+        def request_repaint():
+            if not repaint_timer.isActive():
+                repaint_timer.start()
+
+        # Tooltip texts are built once here; per-event work is index + lookup
+        # with no zip/iterator or string-formatting allocations
+        hover_texts = [f"{k}: {v:g}" for k, v in zip(keys, values)]
+
+        annot = None
+        on_hover = None
+        if kind == "bar":
+            bars = artists
 
             # Tooltip annotation
             annot = ax.annotate(
@@ -184,25 +581,23 @@ class StatisticsViewer(QDialog):
             annot.set_visible(False)
 
             def on_hover(event):
-                visible = False
-                for bar, key, value in zip(bars, keys, values):
-                    if bar.contains(event)[0]:
-                        annot.xy = (event.xdata, event.ydata)
-                        annot.set_text(f"{key}: {value}")
-                        annot.set_visible(True)
-                        visible = True
-                        break
-                if not visible:
+                # Bars sit on a regular integer grid, so the hovered bar index
+                # is a constant-time round instead of an O(bars) contains scan
+                if event.xdata is None:
                     annot.set_visible(False)
-                canvas.draw_idle()
-
-            fig.canvas.mpl_connect("motion_notify_event", on_hover)
+                    request_repaint()
+                    return
+                i = int(round(event.xdata))
+                if 0 <= i < len(bars) and bars[i].contains(event)[0]:
+                    annot.xy = (event.xdata, event.ydata)
+                    annot.set_text(hover_texts[i])
+                    annot.set_visible(True)
+                else:
+                    annot.set_visible(False)
+                request_repaint()
 
         elif kind == "pie":
-            wedges, _ = ax.pie(values, labels=None, textprops={'color': "w"})
-            ax.set_facecolor("#2b2b2b")
-            ax.title.set_text(title)
-            ax.title.set_color("#dddddd")
+            wedges = artists
 
             annot = ax.annotate(
                 "", xy=(0,0), xytext=(20,20),
@@ -212,22 +607,53 @@ class StatisticsViewer(QDialog):
             )
             annot.set_visible(False)
 
+            # Cumulative wedge end-angles, so hover resolves the wedge with a
+            # binary search instead of a contains_point call per wedge
+            theta_edges = np.array([w.theta2 for w in wedges])
+            pie_radius = wedges[0].r if wedges else 1.0
+
             def on_hover(event):
-                visible = False
-                for wedge, key, value in zip(wedges, keys, values):
-                    if wedge.contains_point((event.x, event.y)):
-                        annot.xy = (event.xdata, event.ydata)
-                        annot.set_text(f"{key}: {value}")
-                        annot.set_visible(True)
-                        visible = True
-                        break
-                if not visible:
+                if event.xdata is None or event.ydata is None:
                     annot.set_visible(False)
-                canvas.draw_idle()
+                    request_repaint()
+                    return
+                angle = math.degrees(math.atan2(event.ydata, event.xdata)) % 360.0
+                i = int(np.searchsorted(theta_edges, angle))
+                if math.hypot(event.xdata, event.ydata) <= pie_radius and i < len(wedges):
+                    annot.xy = (event.xdata, event.ydata)
+                    annot.set_text(hover_texts[i])
+                    annot.set_visible(True)
+                else:
+                    annot.set_visible(False)
+                request_repaint()
 
-            fig.canvas.mpl_connect("motion_notify_event", on_hover)
+        if annot is not None:
+            # Only the tooltip changes on hover, so blit it: cache the figure
+            # background after each full draw, then restore the cached pixels
+            # and repaint just the annotation artist per hover update
+            annot.set_animated(True)
+            blit_bg = {"value": None}
 
-        canvas = FigureCanvas(fig)
-        layout.addWidget(canvas)
-        widget.setLayout(layout)
-        return widget
+            def capture_background(event):
+                blit_bg["value"] = canvas.copy_from_bbox(ax.bbox)
+
+            def invalidate_background(event):
+                blit_bg["value"] = None
+
+            def blit_annotation():
+                if blit_bg["value"] is None:
+                    # No cached background yet (first draw / after resize)
+                    canvas.draw_idle()
+                    return
+                canvas.restore_region(blit_bg["value"])
+                if annot.get_visible():
+                    ax.draw_artist(annot)
+                canvas.blit(ax.bbox)
+
+            cids.append(canvas.mpl_connect("draw_event", capture_background))
+            cids.append(canvas.mpl_connect("resize_event", invalidate_background))
+            repaint_timer.timeout.connect(blit_annotation)
+        else:
+            repaint_timer.timeout.connect(canvas.draw_idle)
+
+        return on_hover, cids, repaint_timer
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import csv
+import functools
+import math
+import operator
 import sys
 import os
 from typing import Dict, List, Tuple, Any
@@ -7,18 +11,137 @@ from typing import Dict, List, Tuple, Any
 from PySide6.QtWidgets import (
     QApplication, QDialog, QVBoxLayout, QLabel, QTabWidget, QWidget,
     QLineEdit, QTableView, QHBoxLayout, QPushButton, QFileDialog, QMessageBox,
-    QScrollArea  # Added for scrollable bar chart
+    QScrollArea,  # Added for scrollable bar chart
+    QHeaderView, QToolTip
 )
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QRegularExpression, QUrl
-from PySide6.QtGui import QAction, QDesktopServices
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+    QSortFilterProxyModel, QRegularExpression, QSize, QThreadPool, QTimer,
+    QUrl, Signal
+)
+from PySide6.QtGui import QAction, QColor, QDesktopServices, QPainter
 
 # Use PySide6-compatible matplotlib backend
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 import matplotlib.cm as cm
+import numpy as np
+
+
+
+
+# Horizontal pixels per bar slot and the bar's share of it
+BAR_STRIDE = 25
+BAR_WIDTH = 18
+# How far a 45°-rotated tick label can stick out to the right of its own
+# bar slot; partial repaints must start this much earlier so overhanging
+# labels are not clipped at the expose boundary
+LABEL_OVERHANG = 80
+
+# Shared chart palette, materialized once instead of re-sliced per chart
+_TAB20 = np.array(cm.tab20.colors)
+
+
+class _SaveChartSignals(QObject):
+    finished = Signal(str, str)  # path, error message ("" on success)
+
+
+class _SaveChartTask(QRunnable):
+    """
+    Renders a figure to PNG on a worker thread. savefig only reads the
+    artist tree, which is static for these charts, so no locking is needed.
+    """
+
+    def __init__(self, figure, path: str):
+        super().__init__()
+        self.signals = _SaveChartSignals()
+        self._figure = figure
+        self._path = path
+
+    def run(self):
+        try:
+            self._figure.savefig(self._path, dpi=160, bbox_inches="tight")
+        except Exception as e:
+            self.signals.finished.emit(self._path, str(e))
+        else:
+            self.signals.finished.emit(self._path, "")
+
+
+def _truncate(label: str, max_len: int = 24) -> str:
+    return label if len(label) <= max_len else (label[:max_len - 1] + "…")
 
 
+@functools.lru_cache(maxsize=1024)
+def _format_val(v: float) -> str:
+    return f"{v:,.2f}" if abs(v) >= 1 else f"{v:.4f}"
+
+
+class BarChartWidget(QWidget):
+    """
+    Scrollable bar chart drawn directly with QPainter.
+
+    paintEvent only draws bars intersecting the exposed rect, so paint cost
+    scales with the viewport rather than the category count — unlike the
+    previous FigureCanvas, which rasterized a len(keys)*25 px wide AGG
+    buffer on every redraw. Hover lookup is O(1) arithmetic on the uniform
+    bar grid.
+    """
+
+    def __init__(self, keys: List[str], values: List[float], title: str, parent=None):
+        super().__init__(parent)
+        self._keys = keys
+        self._values = np.asarray(values, dtype=np.float64)
+        self._title = title
+        self._max_value = float(self._values.max()) if len(self._values) else 1.0
+        if self._max_value <= 0:
+            self._max_value = 1.0
+        self.setMouseTracking(True)
+
+    def sizeHint(self) -> QSize:
+        return QSize(max(1200, len(self._keys) * BAR_STRIDE), 500)
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), QColor("#1f1f1f"))
+
+        chart_top = 40
+        chart_bottom = self.height() - 60
+        span = max(1, chart_bottom - chart_top)
+
+        # Only the bars whose x-range intersects the exposed rect, widened
+        # on the left so rotated labels overhanging into the rect still draw
+        first = max(0, (event.rect().left() - LABEL_OVERHANG) // BAR_STRIDE)
+        last = min(len(self._keys), event.rect().right() // BAR_STRIDE + 1)
+
+        bar_color = QColor("#5aa9e6")
+        painter.setPen(QColor("#dddddd"))
+        painter.drawText(10, 25, self._title)
+
+        for i in range(first, last):
+            bar_height = int(self._values[i] / self._max_value * span)
+            x = i * BAR_STRIDE + (BAR_STRIDE - BAR_WIDTH) // 2
+            painter.fillRect(x, chart_bottom - bar_height, BAR_WIDTH, bar_height, bar_color)
+
+            label = self._keys[i]
+            if len(label) > 12:
+                label = label[:11] + "…"
+            painter.save()
+            painter.translate(x + BAR_WIDTH // 2, chart_bottom + 10)
+            painter.rotate(45)
+            painter.drawText(0, 0, label)
+            painter.restore()
+
+    def mouseMoveEvent(self, event) -> None:
+        # Uniform grid: the hovered bar index is plain integer division
+        i = int(event.position().x()) // BAR_STRIDE
+        if 0 <= i < len(self._keys):
+            QToolTip.showText(
+                event.globalPosition().toPoint(),
+                f"{self._keys[i]}\n{self._values[i]:g}",
+                self,
+            )
+        else:
+            QToolTip.hideText()
 
 
 # -----------------------------
@@ -29,11 +152,22 @@ class DictTableModel(QAbstractTableModel):
         super().__init__(parent)
         # Convert dict to a list of tuples once; keep keys as strings for filtering
         self._headers = [col1, col2]
-        # Sorting by key (string) once keeps proxy sorting fast later
-        self._rows: List[Tuple[str, Any]] = sorted(
-            ((str(k), v) for k, v in data_dict.items()),
-            key=lambda kv: kv[0].lower()
-        )
+        # Store the lowercase key and a pre-parsed numeric value alongside
+        # each row so sorting and filtering never lowercase or float-parse
+        # inside the hot comparator. Built with a plain loop (no generator
+        # frame, str() called once per key) and sorted in place rather than
+        # materializing through sorted().
+        rows: List[Tuple[str, str, Any, Any]] = []
+        append = rows.append
+        for k, v in data_dict.items():
+            ks = str(k)
+            try:
+                fv = float(v)
+            except Exception:
+                fv = None
+            append((ks.lower(), ks, v, fv))
+        rows.sort(key=operator.itemgetter(0))
+        self._rows = rows
 
     def rowCount(self, parent=QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self._rows)
@@ -42,10 +176,18 @@ class DictTableModel(QAbstractTableModel):
         return 0 if parent.isValid() else 2
 
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
-        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+        if not index.isValid():
             return None
-        key, val = self._rows[index.row()]
-        return key if index.column() == 0 else str(val)
+        row = self._rows[index.row()]
+        if role == Qt.UserRole:
+            # Cached sort keys: lowercase key for column 0, pre-parsed
+            # float (string fallback) for column 1
+            if index.column() == 0:
+                return row[0]
+            return row[3] if row[3] is not None else str(row[2])
+        if role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return row[1] if index.column() == 0 else str(row[2])
 
     def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
         if role != Qt.DisplayRole:
@@ -54,27 +196,16 @@ class DictTableModel(QAbstractTableModel):
             return self._headers[section]
         return section + 1
 
-    # Enable proxy sorting by returning comparable values
-    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
-        reverse = (order == Qt.DescendingOrder)
-        if column == 0:
-            self.layoutAboutToBeChanged.emit()
-            self._rows.sort(key=lambda r: r[0].lower(), reverse=reverse)
-            self.layoutChanged.emit()
-        else:
-            # Numeric sort if possible, else string
-            def val_key(r):
-                try:
-                    return float(r[1])
-                except Exception:
-                    return str(r[1])
-            self.layoutAboutToBeChanged.emit()
-            self._rows.sort(key=val_key, reverse=reverse)
-            self.layoutChanged.emit()
+    # Header-click sorting is handled by the proxy on the cached Qt.UserRole
+    # keys, so the model needs no custom sort() of its own. The proxy's sort
+    # also remaps its persistent indexes (QSortFilterProxyModel emits its
+    # layout changes with hints), so selection and scroll position survive a
+    # re-sort without the view re-querying every row — the source model's
+    # row order never changes.
 
     # Optional: quick export
     def to_rows(self) -> List[Tuple[str, Any]]:
-        return self._rows[:]
+        return [(r[1], r[2]) for r in self._rows]
 
 
 class ContainsFilterProxy(QSortFilterProxyModel):
@@ -83,12 +214,18 @@ class ContainsFilterProxy(QSortFilterProxyModel):
         super().__init__(parent)
         self.setFilterCaseSensitivity(Qt.CaseInsensitive)
         self.setFilterKeyColumn(0)  # default to first column
+        self._needle = ""
 
     def setFilterString(self, text: str):
-        # Escape user input, use a simple .*text.* contains pattern
-        pattern = QRegularExpression.escape(text)
-        regex = QRegularExpression(f".*{pattern}.*", QRegularExpression.CaseInsensitiveOption)
-        self.setFilterRegularExpression(regex)
+        # Keep a lowercase needle and match it against the model's cached
+        # lowercase keys directly — no regex engine, no QVariant roundtrips
+        self._needle = text.lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._needle:
+            return True
+        return self._needle in self.sourceModel()._rows[source_row][0]
 
 
 # -----------------------------
@@ -129,45 +266,44 @@ class StatisticsViewer(QDialog):
         """)
 
         tabs = QTabWidget()
+        self._tabs = tabs
 
-        # === Summary tab ===
+        # === Summary tab === (only tab built up front)
         tabs.addTab(self._make_summary_tab(stats), "📊 Summary")
 
-        # === Table tabs === (use model/view + proxy for speed)
-        tabs.addTab(
-            self._make_table_tab(stats.get('Tag usage count', {}), "Tag", "Count"),
-            "🏷 Tag Usage"
-        )
-        tabs.addTab(
-            self._make_table_tab(stats.get('Topics per publisher', {}), "Publisher", "Topics"),
-            "🏢 Topics per Publisher"
-        )
-        tabs.addTab(
-            self._make_table_tab(stats.get('Chapters per topic', {}), "Topic", "Chapters"),
-            "📚 Chapters per Topic"
-        )
-
-        # === Chart tabs === (limit categories by default)
-        tabs.addTab(
-            self._make_chart_tab(stats.get('Tag usage count', {}), "Tag Usage Chart", kind="bar", top_n=self._default_top_n),
-            "📊 Tag Chart"
-        )
-        tabs.addTab(
-            self._make_chart_tab(stats.get('Topics per publisher', {}), "Topics per Publisher Chart", kind="bar", top_n=self._default_top_n),
-            "🏢 Publisher Chart"
-        )
-        tabs.addTab(
-            self._make_chart_tab(stats.get('Chapters per topic', {}), "Chapters per Topic Chart", kind="bar", top_n=self._default_top_n),
-            "📚 Topic Chart"
-        )
-        tabs.addTab(
-            self._make_chart_tab(stats.get('Tag usage count', {}), "Tag Usage Pie", kind="pie", top_n=self._default_top_n),
-            "🥧 Tag Pie"
-        )
-        tabs.addTab(
-            self._make_chart_tab(stats.get('Tag usage count', {}), f"Top {self._default_top_n} Tags", kind="bar", top_n=self._default_top_n),
-            "📊 Top Tags"
-        )
+        # === Table and chart tabs === built lazily on first visit, so
+        # opening the dialog pays for the Summary tab only — the models and
+        # matplotlib figures behind unvisited tabs are never created.
+        self._tab_builders: Dict[int, Any] = {}
+        # Shared per-source-dict caches: the Tag usage dict alone feeds one
+        # table tab and three chart tabs, so prepare it once, not four times.
+        # Each value carries the source dict itself — an id() key is only
+        # stable while its dict is alive, so pinning the dict stops a freed
+        # address being reused and served someone else's stale entry.
+        self._prepared: Dict[int, Tuple[Dict[Any, Any], np.ndarray, np.ndarray]] = {}
+        self._models: Dict[int, Tuple[Dict[Any, Any], DictTableModel]] = {}
+        lazy_tabs = [
+            ("🏷 Tag Usage",
+             lambda: self._make_table_tab(stats.get('Tag usage count', {}), "Tag", "Count")),
+            ("🏢 Topics per Publisher",
+             lambda: self._make_table_tab(stats.get('Topics per publisher', {}), "Publisher", "Topics")),
+            ("📚 Chapters per Topic",
+             lambda: self._make_table_tab(stats.get('Chapters per topic', {}), "Topic", "Chapters")),
+            ("📊 Tag Chart",
+             lambda: self._make_chart_tab(stats.get('Tag usage count', {}), "Tag Usage Chart", kind="bar", top_n=self._default_top_n)),
+            ("🏢 Publisher Chart",
+             lambda: self._make_chart_tab(stats.get('Topics per publisher', {}), "Topics per Publisher Chart", kind="bar", top_n=self._default_top_n)),
+            ("📚 Topic Chart",
+             lambda: self._make_chart_tab(stats.get('Chapters per topic', {}), "Chapters per Topic Chart", kind="bar", top_n=self._default_top_n)),
+            ("🥧 Tag Pie",
+             lambda: self._make_chart_tab(stats.get('Tag usage count', {}), "Tag Usage Pie", kind="pie", top_n=self._default_top_n)),
+            ("📊 Top Tags",
+             lambda: self._make_chart_tab(stats.get('Tag usage count', {}), f"Top {self._default_top_n} Tags", kind="bar", top_n=self._default_top_n)),
+        ]
+        for label, builder in lazy_tabs:
+            index = tabs.addTab(QWidget(), label)
+            self._tab_builders[index] = builder
+        tabs.currentChanged.connect(self._ensure_tab_built)
 
         layout = QVBoxLayout()
         layout.addWidget(tabs)
@@ -176,6 +312,22 @@ class StatisticsViewer(QDialog):
         # Optional: simple export action in context (for charts)
         self._add_context_export()
 
+    def _ensure_tab_built(self, index: int) -> None:
+        """
+        Fill a placeholder tab with its real widget on first visit.
+        The build happens inside the placeholder page: removing and
+        re-inserting the current tab would make Qt momentarily select a
+        neighbour, re-entering this slot and cascade-building every
+        remaining placeholder at once.
+        """
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        page = self._tabs.widget(index)
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.addWidget(builder())
+
     # -----------------------------
     # Summary
     # -----------------------------
@@ -219,7 +371,20 @@ class StatisticsViewer(QDialog):
     # -----------------------------
     # Table tabs (efficient)
     # -----------------------------
+    def _placeholder_widget(self, message: str) -> QWidget:
+        """Cheap stand-in for tabs whose stats section is missing/empty."""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        label = QLabel(message)
+        label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(label)
+        return widget
+
     def _make_table_tab(self, data_dict: Dict[Any, Any], col1_name: str, col2_name: str) -> QWidget:
+        # Missing stats section: skip model/proxy/view construction
+        if not data_dict:
+            return self._placeholder_widget("No data available")
+
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(4, 4, 4, 4)
@@ -235,23 +400,48 @@ class StatisticsViewer(QDialog):
         top_row.addWidget(export_btn, 0)
         layout.addLayout(top_row)
 
-        # Model + Proxy + View
-        model = DictTableModel(data_dict, col1_name, col2_name, parent=widget)
+        # Model + Proxy + View (model cached per source dict)
+        cached = self._models.get(id(data_dict))
+        if cached is not None:
+            model = cached[1]
+        else:
+            model = DictTableModel(data_dict, col1_name, col2_name, parent=self)
+            self._models[id(data_dict)] = (data_dict, model)
         proxy = ContainsFilterProxy(widget)
+        # Sort on the cached UserRole keys (lowercase string / pre-parsed
+        # float) and keep dynamic re-sorting off during setup
+        proxy.setSortRole(Qt.UserRole)
+        proxy.setDynamicSortFilter(False)
         proxy.setSourceModel(model)
         proxy.setFilterKeyColumn(0)
 
         table = QTableView()
         table.setModel(proxy)
         table.setSortingEnabled(True)
+        proxy.setDynamicSortFilter(True)
         table.setAlternatingRowColors(True)
         table.verticalHeader().setVisible(False)
-        table.horizontalHeader().setStretchLastSection(True)
+        # Fixed, uniform row heights: the view never measures cell content
+        # for layout, so scroll painting stays O(visible rows)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(22)
+        table.setWordWrap(False)
+        table.setShowGrid(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Interactive)
+        table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
 
         layout.addWidget(table)
 
-        # Connect search
-        search.textChanged.connect(proxy.setFilterString)
+        # Connect search with a short debounce: a typing burst triggers one
+        # filter pass instead of one per keystroke; Enter filters immediately
+        filter_timer = QTimer(widget)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(150)
+        filter_timer.timeout.connect(lambda: proxy.setFilterString(search.text()))
+        search.textChanged.connect(lambda _text: filter_timer.start())
+        search.returnPressed.connect(
+            lambda: (filter_timer.stop(), proxy.setFilterString(search.text()))
+        )
 
         # Export handler
         def do_export():
@@ -262,16 +452,20 @@ class StatisticsViewer(QDialog):
             if not path:
                 return
             try:
-                # Export only currently filtered rows from proxy
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(f"{col1_name},{col2_name}\n")
-                    for r in range(proxy.rowCount()):
-                        k = proxy.index(r, 0).data()
-                        v = proxy.index(r, 1).data()
-                        # Basic escaping of commas/quotes
-                        k_esc = '"' + str(k).replace('"', '""') + '"'
-                        v_esc = '"' + str(v).replace('"', '""') + '"'
-                        f.write(f"{k_esc},{v_esc}\n")
+                # Export only currently filtered rows from proxy. csv.writer
+                # quotes in C and writerows batches through a large buffer,
+                # reading the model's row tuples directly instead of pulling
+                # each cell back out through data().
+                src = model._rows
+                with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+                    writer = csv.writer(f)
+                    writer.writerow([col1_name, col2_name])
+                    writer.writerows(
+                        (row[1], row[2]) for row in (
+                            src[proxy.mapToSource(proxy.index(r, 0)).row()]
+                            for r in range(proxy.rowCount())
+                        )
+                    )
                 QMessageBox.information(widget, "Export CSV", f"Saved: {path}")
             except Exception as e:
                 QMessageBox.critical(widget, "Export CSV", f"Failed to save CSV:\n{e}")
@@ -283,7 +477,32 @@ class StatisticsViewer(QDialog):
     # -----------------------------
     # Charts
     # -----------------------------
+    def _prepared_arrays(self, data_dict: Dict[Any, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Clean a stats dict into (keys, values) arrays sorted by value
+        descending, cached per source dict so the several chart tabs built
+        from the same dict share one pass over it.
+        """
+        cached = self._prepared.get(id(data_dict))
+        if cached is not None:
+            return cached[1], cached[2]
 
+        clean_keys: List[str] = []
+        clean_vals: List[float] = []
+        for k, v in data_dict.items():
+            try:
+                fv = float(v)
+            except Exception:
+                continue
+            clean_keys.append(str(k))
+            clean_vals.append(fv)
+
+        keys_arr = np.array(clean_keys, dtype=object)
+        vals_arr = np.asarray(clean_vals, dtype=np.float64)
+        order = np.argsort(-vals_arr)
+        keys_arr, vals_arr = keys_arr[order], vals_arr[order]
+        self._prepared[id(data_dict)] = (data_dict, keys_arr, vals_arr)
+        return keys_arr, vals_arr
 
     # -----------------------------
     # Charts
@@ -302,141 +521,70 @@ class StatisticsViewer(QDialog):
         - Pie charts: Groups leftover as "Others", supports recursive drilldown.
         """
 
+        # Missing stats section: no layout, no model, no figure
+        if not data_dict:
+            return self._placeholder_widget("No data available")
+
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        # --- Clean data ---
-        items: List[Tuple[str, float]] = []
-        for k, v in data_dict.items():
-            try:
-                items.append((str(k), float(v)))
-            except Exception:
-                continue
-
-        # Sort descending
-        items.sort(key=lambda x: x[1], reverse=True)
+        # --- Clean data (prepared once per source dict, shared across tabs) ---
+        keys_arr, vals_arr = self._prepared_arrays(data_dict)
 
-        # Handle leftover for PIE charts only
         leftover_items: List[Tuple[str, float]] = []
-        if top_n and kind == "pie" and len(items) > top_n:
-            leftover_items = items[top_n:]
-            top_items = items[:top_n]
-            other_sum = sum(v for _, v in leftover_items)
-            top_items.append(("Others", other_sum))
-            items = top_items
-
-        keys = [k for k, _ in items]
-        values = [v for _, v in items]
-
-        # --- Matplotlib setup ---
-        fig = Figure(figsize=(7, 5), dpi=100, facecolor="#1f1f1f")
-        ax = fig.add_subplot(111)
-
-        if not items:
-            ax.text(0.5, 0.5, "No numeric data", color="#dddddd",
-                    ha='center', va='center', transform=ax.transAxes)
-            ax.set_axis_off()
-            canvas = FigureCanvas(fig)
-            layout.addWidget(canvas)
-            return widget
+        if top_n and kind == "pie" and len(vals_arr) > top_n:
+            leftover_items = list(zip(keys_arr[top_n:].tolist(), vals_arr[top_n:].tolist()))
+            keys = keys_arr[:top_n].tolist() + ["Others"]
+            values = vals_arr[:top_n].tolist() + [float(vals_arr[top_n:].sum())]
+        else:
+            keys = keys_arr.tolist()
+            values = vals_arr.tolist()
 
-        def truncate(label: str, max_len: int = 24) -> str:
-            return label if len(label) <= max_len else (label[:max_len - 1] + "…")
+        items = list(zip(keys, values))
 
-        def format_val(v: float) -> str:
-            return f"{v:,.2f}" if abs(v) >= 1 else f"{v:.4f}"
+        # Nothing numeric survived cleaning: skip model/figure setup entirely
+        if not items:
+            return self._placeholder_widget("No numeric data")
 
+        # Truncated tick labels computed once, not per-branch per-draw
+        labels = [_truncate(k) for k in keys]
 
         # =====================================================
         # VERTICAL BAR CHART (scrollable, fixed figure height)
         # =====================================================
         if kind == "bar":
-            # Sort values descending
-            items.sort(key=lambda x: x[1], reverse=True)
-            keys = [k for k, _ in items]
-            values = [v for _, v in items]
-
-            # Fixed height figure, but width adjusts with tags
-            fig = Figure(figsize=(12, 6), dpi=100, facecolor="#1f1f1f")
-            ax = fig.add_subplot(111)
-
-            x_pos = range(len(keys))
-            bars = ax.bar(x_pos, values, color="#5aa9e6")
-
-            # X-axis labels
-            ax.set_xticks(x_pos)
-            ax.set_xticklabels(
-                [truncate(k, 20) for k in keys],
-                rotation=45, ha='right', color="#dddddd", fontsize=8
-            )
-
-            ax.tick_params(axis='y', colors="#dddddd")
-            for spine in ax.spines.values():
-                spine.set_color("#444444")
-            ax.set_facecolor("#1f1f1f")
-            ax.set_title(title, color="#dddddd")
-
-            fig.tight_layout(pad=2.0)
-            canvas = FigureCanvas(fig)
+            # keys/values already arrive sorted descending from the prep
+            # above; no matplotlib figure involved for bars
+            chart = BarChartWidget(keys, values, title)
+            chart.setMinimumWidth(max(1200, len(keys) * BAR_STRIDE))
+            chart.setMinimumHeight(400)
 
-            # --- Make it scrollable ---
             scroll = QScrollArea()
-            scroll.setWidget(canvas)
+            scroll.setWidget(chart)
             scroll.setWidgetResizable(True)
             scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
             scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-            # Dynamically set canvas width so it doesn’t cram labels
-            min_width = max(1200, len(keys) * 25)  # 25px per tag
-            canvas.setMinimumWidth(min_width)
-            canvas.setMinimumHeight(500)
-
-            # Tooltip on hover
-            annot = ax.annotate(
-                "", xy=(0, 0), xytext=(12, 12), textcoords="offset points",
-                bbox=dict(boxstyle="round", fc=(0, 0, 0, 0.8), ec="#dddddd"),
-                fontsize=9, color="#ffffff", ha='left'
-            )
-            annot.set_visible(False)
-
-            def on_hover(event):
-                if event.inaxes != ax:
-                    if annot.get_visible():
-                        annot.set_visible(False)
-                        canvas.draw_idle()
-                    return
-                vis = False
-                for bar, k, v in zip(bars, keys, values):
-                    if bar.contains(event)[0]:
-                        annot.xy = (event.x, event.y)
-                        annot.set_text(f"{k}\n{v:g}")
-                        annot.set_visible(True)
-                        vis = True
-                        break
-                if not vis and annot.get_visible():
-                    annot.set_visible(False)
-                canvas.draw_idle()
-
-            canvas.mpl_connect("motion_notify_event", on_hover)
-
-            # Add toolbar + scrollable chart
-            layout.addWidget(NavigationToolbar(canvas, self))
             layout.addWidget(scroll)
+            return widget
 
-
-
+        # --- Matplotlib setup (figure-based chart kinds only) ---
+        # dpi=80 keeps the on-screen AGG buffer ~40% smaller than the old
+        # dpi=100; right-click export re-renders at dpi=160 so saved PNGs
+        # keep their quality
+        fig = Figure(figsize=(9, 5), dpi=80, facecolor="#1f1f1f")
+        ax = fig.add_subplot(111)
 
 
         # =====================================================
         # PIE CHART (with recursive "Others" drilldown)
         # =====================================================
-        elif kind == "pie":
-            colors = cm.tab20.colors
+        if kind == "pie":
             wedges, _ = ax.pie(
                 values,
-                colors=colors[:len(values)],
+                colors=_TAB20[:len(values)],
                 labels=None,
                 autopct=None,
                 normalize=True,
@@ -448,6 +596,7 @@ class StatisticsViewer(QDialog):
             ax.set_title(title, color="#dddddd", fontsize=14, pad=10)
 
             canvas = FigureCanvas(fig)
+            canvas.setAttribute(Qt.WA_OpaquePaintEvent)
 
             # Tooltip
             annot = ax.annotate(
@@ -457,24 +606,67 @@ class StatisticsViewer(QDialog):
             )
             annot.set_visible(False)
 
+            # Tooltip text per wedge built once; the hover handler only
+            # indexes into it instead of summing and formatting per event
+            total = sum(values) or 1.0
+            hover_texts = [
+                f"{k}\n{_format_val(v)} ({v / total * 100.0:.1f}%)"
+                for k, v in zip(keys, values)
+            ]
+
+            # Wedges partition the circle, so the hovered wedge follows from
+            # the cursor angle with one binary search over the cumulative
+            # wedge edges — no per-wedge contains() scan
+            theta_edges = np.array([w.theta2 for w in wedges])
+            pie_radius = wedges[0].r if wedges else 1.0
+            center = wedges[0].center if wedges else (0.0, 0.0)
+
+            # Blit the annotation over a cached background instead of
+            # re-rendering every wedge per mouse move. The cache refreshes
+            # after each full draw and is dropped on resize.
+            annot.set_animated(True)
+            blit_bg = {"value": None}
+
+            def on_draw(_event):
+                blit_bg["value"] = canvas.copy_from_bbox(ax.bbox)
+
+            def on_resize(_event):
+                blit_bg["value"] = None
+
+            canvas.mpl_connect("draw_event", on_draw)
+            canvas.mpl_connect("resize_event", on_resize)
+
+            def blit_annotation():
+                if blit_bg["value"] is None:
+                    # No background captured yet; fall back to a full draw
+                    # (which repopulates the cache via draw_event)
+                    canvas.draw_idle()
+                    return
+                canvas.restore_region(blit_bg["value"])
+                if annot.get_visible():
+                    ax.draw_artist(annot)
+                canvas.blit(ax.bbox)
+
             def on_hover(event):
-                if event.inaxes != ax:
+                if event.inaxes != ax or event.xdata is None:
                     if annot.get_visible():
                         annot.set_visible(False)
-                        canvas.draw_idle()
+                        blit_annotation()
                     return
-                vis = False
-                for wedge, k, v in zip(wedges, keys, values):
-                    if wedge.contains(event)[0]:
-                        annot.xy = (event.xdata, event.ydata)
-                        pct = (v / sum(values) * 100.0) if values else 0.0
-                        annot.set_text(f"{k}\n{format_val(v)} ({pct:.1f}%)")
-                        annot.set_visible(True)
-                        vis = True
-                        break
-                if not vis and annot.get_visible():
+                dx = event.xdata - center[0]
+                dy = event.ydata - center[1]
+                i = -1
+                if dx * dx + dy * dy <= pie_radius * pie_radius:
+                    angle = math.degrees(math.atan2(dy, dx)) % 360.0
+                    i = int(np.searchsorted(theta_edges, angle))
+                if 0 <= i < len(wedges):
+                    annot.xy = (event.xdata, event.ydata)
+                    annot.set_text(hover_texts[i])
+                    annot.set_visible(True)
+                    blit_annotation()
+                elif annot.get_visible():
                     annot.set_visible(False)
-                canvas.draw_idle()
+                    blit_annotation()
 
             def on_double_click(event):
                 for wedge, k in zip(wedges, keys):
@@ -503,46 +695,55 @@ class StatisticsViewer(QDialog):
             ax.plot(range(len(keys)), values, marker="o",
                     color="#5aa9e6", linewidth=2)
             ax.set_xticks(range(len(keys)))
-            ax.set_xticklabels([truncate(k) for k in keys],
+            ax.set_xticklabels(labels,
                                rotation=45, ha='right', color="#dddddd", fontsize=9)
             ax.tick_params(axis='y', colors="#dddddd")
             ax.set_facecolor("#1f1f1f")
             ax.set_title(title, color="#dddddd")
             fig.tight_layout(pad=2.0)
-            layout.addWidget(FigureCanvas(fig))
+            canvas = FigureCanvas(fig)
+            canvas.setAttribute(Qt.WA_OpaquePaintEvent)
+            layout.addWidget(canvas)
 
         elif kind == "scatter":
             ax.scatter(range(len(keys)), values, color="#f28482", s=50, alpha=0.8)
             ax.set_xticks(range(len(keys)))
-            ax.set_xticklabels([truncate(k) for k in keys],
+            ax.set_xticklabels(labels,
                                rotation=45, ha='right', color="#dddddd", fontsize=9)
             ax.tick_params(axis='y', colors="#dddddd")
             ax.set_facecolor("#1f1f1f")
             ax.set_title(title, color="#dddddd")
             fig.tight_layout(pad=2.0)
-            layout.addWidget(FigureCanvas(fig))
+            canvas = FigureCanvas(fig)
+            canvas.setAttribute(Qt.WA_OpaquePaintEvent)
+            layout.addWidget(canvas)
 
         elif kind == "stacked":
             if isinstance(items[0][1], dict):  # stacked grouped data
                 subkeys = list(items[0][1].keys())
-                bottoms = [0] * len(keys)
-                colors = cm.tab20.colors
+                # One N×K matrix, then a vectorized running sum per segment
+                # instead of rebuilding a Python bottoms list K times
+                mat = np.array([[row[sub] for sub in subkeys] for _, row in items],
+                               dtype=np.float64)
+                bottoms = np.zeros(len(keys))
+                seg_colors = _TAB20[np.arange(len(subkeys)) % len(_TAB20)]
                 for i, sub in enumerate(subkeys):
-                    vals = [v[sub] for _, v in items]
-                    ax.bar(keys, vals, bottom=bottoms,
-                           label=sub, color=colors[i % len(colors)])
-                    bottoms = [b + v for b, v in zip(bottoms, vals)]
+                    ax.bar(keys, mat[:, i], bottom=bottoms,
+                           label=sub, color=seg_colors[i])
+                    bottoms += mat[:, i]
                 ax.legend(facecolor="#1f1f1f", labelcolor="#dddddd")
             else:
                 ax.bar(keys, values, color="#5aa9e6")
 
-            ax.set_xticklabels([truncate(k) for k in keys],
+            ax.set_xticklabels(labels,
                                rotation=45, ha='right', color="#dddddd", fontsize=9)
             ax.tick_params(axis='y', colors="#dddddd")
             ax.set_facecolor("#1f1f1f")
             ax.set_title(title, color="#dddddd")
             fig.tight_layout(pad=2.0)
-            layout.addWidget(FigureCanvas(fig))
+            canvas = FigureCanvas(fig)
+            canvas.setAttribute(Qt.WA_OpaquePaintEvent)
+            layout.addWidget(canvas)
 
         return widget
 
@@ -581,11 +782,17 @@ class StatisticsViewer(QDialog):
         path, _ = QFileDialog.getSaveFileName(self, "Save Chart as PNG", "chart.png", "PNG Image (*.png)")
         if not path:
             return
-        try:
-            canvas.figure.savefig(path, dpi=160, bbox_inches="tight")
+        # High-dpi rendering plus disk I/O can take seconds; run it on the
+        # global thread pool so the dialog stays responsive
+        task = _SaveChartTask(canvas.figure, path)
+        task.signals.finished.connect(self._on_chart_saved)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_chart_saved(self, path: str, error: str):
+        if error:
+            QMessageBox.critical(self, "Save Chart", f"Failed to save chart:\n{error}")
+        else:
             QMessageBox.information(self, "Save Chart", f"Saved: {path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Save Chart", f"Failed to save chart:\n{e}")
 
     def _show_drilldown(self, data: Dict[str, float], title: str = "Others Breakdown"):
         dlg = QDialog(self)
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import sys
 import csv
+import heapq
 import json
+import operator
 from typing import Dict, List, Tuple, Any
 
 from PySide6.QtWidgets import (
@@ -70,12 +72,15 @@ class ContainsFilterProxy(QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.setFilterKeyColumn(0) 
+        self.setFilterKeyColumn(0)
+        # One regex object reused across keystrokes; only the pattern text
+        # changes, so Qt's pattern optimization is not redone from scratch
+        self._regex = QRegularExpression("", QRegularExpression.CaseInsensitiveOption)
+        self._regex.optimize()
 
     def setFilterString(self, text: str):
-        pattern = QRegularExpression.escape(text)
-        regex = QRegularExpression(f".*{pattern}.*", QRegularExpression.CaseInsensitiveOption)
-        self.setFilterRegularExpression(regex)
+        self._regex.setPattern(QRegularExpression.escape(text))
+        self.setFilterRegularExpression(self._regex)
 
 
 # ==========================================
@@ -164,17 +169,29 @@ class AdvancedChartWidget(QWidget):
             except: continue
 
         sort_mode = self.sort_cb.currentText()
-        if sort_mode == "Value (Descending)": items.sort(key=lambda x: x[1], reverse=True)
-        elif sort_mode == "Value (Ascending)": items.sort(key=lambda x: x[1], reverse=False)
-        else: items.sort(key=lambda x: x[0].lower())
-
         limit = self.limit_spin.value()
-        if len(items) > limit and self.type_cb.currentText() == "Pie":
-            leftovers = items[limit:]
-            items = items[:limit]
-            items.append(("Others", sum(v for _, v in leftovers)))
-        elif len(items) > limit:
-            items = items[:limit]
+        is_pie = self.type_cb.currentText() == "Pie"
+
+        if len(items) > limit and sort_mode.startswith("Value"):
+            # Only `limit` entries survive, so a bounded heap selection
+            # (O(N log limit)) beats sorting the whole list
+            total = sum(v for _, v in items) if is_pie else 0.0
+            if sort_mode == "Value (Descending)":
+                items = heapq.nlargest(limit, items, key=operator.itemgetter(1))
+            else:
+                items = heapq.nsmallest(limit, items, key=operator.itemgetter(1))
+            if is_pie:
+                items.append(("Others", total - sum(v for _, v in items)))
+        else:
+            if sort_mode == "Value (Descending)": items.sort(key=lambda x: x[1], reverse=True)
+            elif sort_mode == "Value (Ascending)": items.sort(key=lambda x: x[1], reverse=False)
+            else: items.sort(key=lambda x: x[0].lower())
+            if len(items) > limit and is_pie:
+                leftovers = items[limit:]
+                items = items[:limit]
+                items.append(("Others", sum(v for _, v in leftovers)))
+            elif len(items) > limit:
+                items = items[:limit]
 
         return [k for k, _ in items], [v for _, v in items]
 
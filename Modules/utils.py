@@ -1,4 +1,5 @@
 import os
+import subprocess
 import sys
 
 
@@ -7,11 +8,18 @@ def load_tags(tag_file):
     """
     Load tags from a comma-separated file, removing whitespace.
     Returns a list of tags.
+
+    Reads in binary and splits/strips the raw bytes, decoding only the
+    surviving tags — across thousands of small files that is cheaper than
+    decoding every file up front. Missing files are handled by the open()
+    itself rather than a separate isfile() stat.
     """
-    if os.path.isfile(tag_file):
-        with open(tag_file, 'r', encoding='utf-8') as f:
-            return [t.strip() for t in f.read().split(',') if t.strip()]
-    return []
+    try:
+        with open(tag_file, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return []
+    return [t.decode('utf-8', 'replace') for t in (s.strip() for s in data.split(b',')) if t]
 
 
 def save_tags(tag_file, tags):
@@ -28,7 +36,19 @@ def open_folder(path):
     """
     if os.name == 'nt':  # Windows
         os.startfile(path)
-    elif sys.platform == 'darwin':  # macOS
-        os.system(f'open "{path}"')
-    else:  # Linux and others
-        os.system(f'xdg-open "{path}"')
+        return
+    # Exec the opener directly instead of going through os.system: no
+    # /bin/sh fork per click, and the path is passed as a single argument
+    # so spaces and quotes in folder names cannot break (or inject into)
+    # a shell command line
+    opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+    try:
+        subprocess.Popen(
+            [opener, path],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=True,
+        )
+    except OSError as exc:
+        # No opener installed (or not executable): degrade with a note
+        # instead of raising out of a Qt slot, matching the old os.system
+        # behaviour which failed silently here
+        print(f"Could not open {path!r}: {exc}", file=sys.stderr)